@@ -1,5 +1,86 @@
 import bpy
 import os
+import numpy as np
+from .utils import srgb_to_linear, linear_to_srgb, is_impostor
+
+# Principled BSDF input each baked map is wired into on LOD materials
+LOD_BAKE_INPUTS = {
+    'DIFFUSE': "Base Color",
+    'ROUGHNESS': "Roughness",
+    'EMIT': "Emission Color",
+    'NORMAL': "Normal",
+}
+
+
+# Mip helpers
+def decode_pixels(pixels, bake_type, colorspace):
+    """Convert stored pixel values into the space they should be filtered in."""
+    pixels = pixels.copy()
+    if bake_type == 'NORMAL':
+        pixels[..., :3] = pixels[..., :3] * 2.0 - 1.0
+    elif colorspace == 'sRGB':
+        pixels[..., :3] = srgb_to_linear(pixels[..., :3])
+    return pixels
+
+def encode_pixels(pixels, bake_type, colorspace):
+    pixels = pixels.copy()
+    if bake_type == 'NORMAL':
+        pixels[..., :3] = pixels[..., :3] * 0.5 + 0.5
+    elif colorspace == 'sRGB':
+        pixels[..., :3] = linear_to_srgb(pixels[..., :3])
+    return np.clip(pixels, 0.0, 1.0)
+
+def next_mip_size(size):
+    """Largest power of two below `size`, so odd base resolutions snap onto the chain."""
+    return 1 << ((size - 1).bit_length() - 1) if size > 1 else 1
+
+def resample_axis(pixels, axis, size):
+    """Area-average `pixels` along `axis` down to `size` samples (at most 2x smaller)."""
+    length = pixels.shape[axis]
+    scale = length / size
+    lo = np.arange(size) * scale
+    hi = lo + scale
+    first = np.floor(lo).astype(np.int64)
+
+    shape = [1] * pixels.ndim
+    shape[axis] = size
+    result = np.zeros(pixels.shape[:axis] + (size,) + pixels.shape[axis + 1:], dtype=np.float32)
+    # A source texel overlaps at most three destination texels for scales up to 2
+    for tap in range(3):
+        index = first + tap
+        weight = np.clip(np.minimum(hi, index + 1) - np.maximum(lo, index), 0.0, None) / scale
+        index = np.minimum(index, length - 1)
+        result += np.take(pixels, index, axis=axis) * weight.reshape(shape).astype(np.float32)
+    return result
+
+def downsample_pixels(pixels, bake_type):
+    """Box filter a (height, width, 4) array to the next power of two in decoded space."""
+    height, width = pixels.shape[:2]
+    pixels = resample_axis(pixels, 0, next_mip_size(height))
+    pixels = resample_axis(pixels, 1, next_mip_size(width))
+
+    if bake_type == 'NORMAL':
+        vectors = pixels[..., :3]
+        length = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        flat = np.zeros_like(vectors)
+        flat[..., 2] = 1.0
+        pixels[..., :3] = np.where(length > 1e-6, vectors / np.maximum(length, 1e-6), flat)
+    return pixels
+
+def build_mip_chain(image, bake_type):
+    """Return encoded pixel arrays for every power-of-two mip level below the full-size image."""
+    width, height = image.size
+    colorspace = image.colorspace_settings.name
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = decode_pixels(pixels.reshape(height, width, 4), bake_type, colorspace)
+
+    chain = []
+    while pixels.shape[0] > 1 or pixels.shape[1] > 1:
+        pixels = downsample_pixels(pixels, bake_type)
+        chain.append(encode_pixels(pixels, bake_type, colorspace))
+    return chain
+
 
 # Operator
 class MaterialBakerOperator(bpy.types.Operator):
@@ -23,6 +104,88 @@ class MaterialBakerOperator(bpy.types.Operator):
             scene.render.bake.use_pass_indirect = True
             scene.render.bake.use_pass_color = True
 
+    def generate_lod_variants(self, obj, image, bake_type, base_path, image_format):
+        chain = build_mip_chain(image, bake_type)
+
+        mips = []
+        for level, pixels in enumerate(chain, start=1):
+            height, width = pixels.shape[:2]
+            mip_name = f"{image.name}_mip{level}"
+            old_mip = bpy.data.images.get(mip_name)
+            if old_mip:
+                bpy.data.images.remove(old_mip)
+
+            mip = bpy.data.images.new(name=mip_name, width=width, height=height, alpha=True, float_buffer=False)
+            # Normal bakes are written raw, whatever the base image is tagged as
+            mip.colorspace_settings.name = 'Non-Color' if bake_type == 'NORMAL' else image.colorspace_settings.name
+            mip.pixels.foreach_set(pixels.ravel())
+
+            if base_path:
+                final_path = os.path.splitext(base_path)[0] + f"_{bake_type.lower()}_mip{level}.{image_format.lower()}"
+                mip.filepath_raw = final_path
+                mip.file_format = image_format
+                try:
+                    mip.save()
+                except RuntimeError as e:
+                    self.report({'ERROR'}, f"Failed to save {mip_name}: {str(e)}")
+
+            mip.pack()
+            mips.append(mip)
+
+        # LOD N gets the variant downsampled N times; impostors keep their atlas material
+        for idx, item in enumerate(obj.lod_items):
+            if is_impostor(item.lod_object) or bake_type not in LOD_BAKE_INPUTS:
+                continue
+            if item.lod_object and item.lod_object.type == 'MESH' and mips:
+                variant = mips[min(idx, len(mips) - 1)]
+                self.assign_lod_variant(obj, item.lod_object, idx + 1, variant, bake_type)
+
+        self.report({'INFO'}, f"{bake_type}: generated {len(mips)} mip levels")
+
+    def assign_lod_variant(self, base_obj, lod_obj, lod_number, image, bake_type):
+        base_mat = base_obj.data.materials[0]
+
+        # LOD meshes share materials with the base object, so each LOD gets its own copy,
+        # refreshed from the base material once per bake run
+        mat_name = f"{lod_obj.name}_Baked"
+        mat = bpy.data.materials.get(mat_name)
+        if mat is None or lod_obj.name not in self.refreshed_lods:
+            if mat is not None:
+                bpy.data.materials.remove(mat)
+            mat = base_mat.copy()
+            mat.name = mat_name
+            self.refreshed_lods.add(lod_obj.name)
+        if lod_obj.data.materials:
+            lod_obj.data.materials[0] = mat
+        else:
+            lod_obj.data.materials.append(mat)
+
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+
+        input_name = LOD_BAKE_INPUTS.get(bake_type)
+        bsdf = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        if input_name is None or bsdf is None or input_name not in bsdf.inputs:
+            return
+
+        node_name = f"LOD_Bake_{bake_type}"
+        tex_node = nodes.get(node_name)
+        if tex_node is None:
+            tex_node = nodes.new("ShaderNodeTexImage")
+            tex_node.name = node_name
+            tex_node.label = f"{bake_type.title()} (LOD {lod_number})"
+        tex_node.image = image
+
+        if bake_type == 'NORMAL':
+            normal_node = nodes.get("LOD_Bake_NormalMap")
+            if normal_node is None:
+                normal_node = nodes.new("ShaderNodeNormalMap")
+                normal_node.name = "LOD_Bake_NormalMap"
+            links.new(tex_node.outputs["Color"], normal_node.inputs["Color"])
+            links.new(normal_node.outputs["Normal"], bsdf.inputs[input_name])
+        else:
+            links.new(tex_node.outputs["Color"], bsdf.inputs[input_name])
+
     def execute(self, context):
         obj = context.object
         if obj is None or obj.type != 'MESH':
@@ -34,6 +197,7 @@ class MaterialBakerOperator(bpy.types.Operator):
         res_x = res_y = scene.material_baker_resolution
         image_format = scene.material_baker_image_format
         base_path = bpy.path.abspath(scene.material_baker_filepath)
+        self.refreshed_lods = set()
 
         bpy.context.scene.render.engine = 'CYCLES'
 
@@ -106,6 +270,9 @@ class MaterialBakerOperator(bpy.types.Operator):
             # Clean up baking node
             nodes.remove(tex_node)
 
+            if scene.material_baker_generate_lod_variants:
+                self.generate_lod_variants(obj, image, b_type, base_path, image_format)
+
             wm.progress_update(progress + 50)
 
         wm.progress_update(100)
@@ -167,6 +334,12 @@ def register():
         subtype='FILE_PATH'
     )
 
+    bpy.types.Scene.material_baker_generate_lod_variants = bpy.props.BoolProperty(
+        name="Generate LOD Variants",
+        description="Build a mip chain for each baked map and assign downsampled variants to LOD objects",
+        default=False
+    )
+
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -175,3 +348,4 @@ def unregister():
     del bpy.types.Scene.material_baker_resolution
     del bpy.types.Scene.material_baker_image_format
     del bpy.types.Scene.material_baker_filepath
+    del bpy.types.Scene.material_baker_generate_lod_variants
@@ -1,6 +1,9 @@
 import bpy
 import bmesh
 import os
+import tempfile
+import numpy as np
+from mathutils import Matrix, Vector
 from bpy.props import *
 from .utils import *
 from bpy.props import (
@@ -127,14 +130,274 @@ class OBJECT_OT_add_lod(bpy.types.Operator):
             self.report({'ERROR'}, "Select a mesh object")
             return {'CANCELLED'}
 
+        # Keep an existing impostor as the last LOD
+        lod_number = len(base_obj.lod_items) + 1
+        impostor = base_obj.lod_items[-1].lod_object if base_obj.lod_items else None
+        if is_impostor(impostor):
+            impostor.name = f"{base_obj.name}_LOD_{lod_number}"
+            lod_number -= 1
+        else:
+            impostor = None
+
         lod_obj = base_obj.copy()
         lod_obj.data = base_obj.data.copy()
-        lod_obj.name = f"{base_obj.name}_LOD_{len(base_obj.lod_items)+1}"
+        lod_obj.name = f"{base_obj.name}_LOD_{lod_number}"
         context.collection.objects.link(lod_obj)
 
         mod = lod_obj.modifiers.new(name="LOD_Decimate", type='DECIMATE')
         mod.ratio = settings.lod_default_ratio
 
+        item = base_obj.lod_items.add()
+        item.lod_object = lod_obj
+        if impostor:
+            base_obj.lod_items.move(len(base_obj.lod_items) - 1, len(base_obj.lod_items) - 2)
+        return {'FINISHED'}
+
+# Largest atlas edge in pixels. At 4096px the uint8 albedo/normal atlases take 64 MiB each and the
+# float16 depth atlas 128 MiB, plus one transient float32 copy (256 MiB) while handing each to Blender
+MAX_IMPOSTOR_ATLAS = 4096
+
+class OBJECT_OT_add_impostor_lod(bpy.types.Operator):
+    bl_idname = "object.add_impostor_lod"
+    bl_label = "Add Impostor LOD"
+    bl_options = {'REGISTER', 'UNDO'}
+    bl_description = "Renders an octahedral impostor atlas and adds it as the last LOD"
+
+    def engine_id(self, engine):
+        if engine == 'CYCLES':
+            return 'CYCLES'
+        # EEVEE is registered as BLENDER_EEVEE_NEXT in 4.2 - 4.x
+        engines = bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items.keys()
+        return 'BLENDER_EEVEE_NEXT' if 'BLENDER_EEVEE_NEXT' in engines else 'BLENDER_EEVEE'
+
+    def setup_scene(self, scene, camera, base_obj, settings, radius, output_dir):
+        scene.collection.objects.link(base_obj)
+
+        render = scene.render
+        render.engine = self.engine_id(settings.impostor_render_engine)
+        render.resolution_x = render.resolution_y = settings.impostor_frame_resolution
+        render.resolution_percentage = 100
+        render.film_transparent = True
+        if render.engine == 'CYCLES':
+            scene.cycles.samples = 16
+            scene.cycles.use_denoising = False
+        else:
+            scene.eevee.taa_render_samples = 16
+
+        view_layer = scene.view_layers[0]
+        view_layer.use_pass_diffuse_color = True
+        view_layer.use_pass_normal = True
+        view_layer.use_pass_z = True
+
+        cam_data = camera.data
+        cam_data.type = 'ORTHO'
+        cam_data.ortho_scale = radius * 2.0
+        cam_data.clip_start = radius * 0.5
+        cam_data.clip_end = radius * 3.5
+        scene.collection.objects.link(camera)
+        scene.camera = camera
+
+        # Passes are written by the compositor since Render Result pixels are not readable
+        scene.use_nodes = True
+        tree = scene.node_tree
+        tree.nodes.clear()
+        layers = tree.nodes.new("CompositorNodeRLayers")
+        layers.scene = scene
+
+        set_alpha = tree.nodes.new("CompositorNodeSetAlpha")
+        set_alpha.mode = 'REPLACE_ALPHA'
+        tree.links.new(layers.outputs["DiffCol"], set_alpha.inputs["Image"])
+        tree.links.new(layers.outputs["Alpha"], set_alpha.inputs["Alpha"])
+
+        composite = tree.nodes.new("CompositorNodeComposite")
+        tree.links.new(set_alpha.outputs["Image"], composite.inputs["Image"])
+
+        file_output = tree.nodes.new("CompositorNodeOutputFile")
+        file_output.base_path = output_dir
+        file_output.format.file_format = 'OPEN_EXR'
+        file_output.format.color_mode = 'RGBA'
+        file_output.format.color_depth = '32'
+        file_output.file_slots[0].path = "albedo_"
+        file_output.file_slots.new("normal_")
+        file_output.file_slots.new("depth_")
+        tree.links.new(set_alpha.outputs["Image"], file_output.inputs[0])
+        tree.links.new(layers.outputs["Normal"], file_output.inputs[1])
+        tree.links.new(layers.outputs["Depth"], file_output.inputs[2])
+
+    def read_pass(self, output_dir, name, frame, size):
+        path = os.path.join(output_dir, f"{name}_{frame:04d}.exr")
+        image = bpy.data.images.load(path, check_existing=False)
+        pixels = np.empty(size * size * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        bpy.data.images.remove(image)
+        return pixels.reshape(size, size, 4)
+
+    def create_atlas(self, name, pixels, non_color):
+        height, width = pixels.shape[:2]
+        old = bpy.data.images.get(name)
+        if old:
+            bpy.data.images.remove(old)
+        # Byte atlases are stored as uint8, float atlases (depth) as float16
+        float_buffer = pixels.dtype != np.uint8
+        image = bpy.data.images.new(name=name, width=width, height=height, alpha=True, float_buffer=float_buffer)
+        if non_color:
+            image.colorspace_settings.name = 'Non-Color'
+        values = pixels.astype(np.float32).ravel()
+        if not float_buffer:
+            values /= 255.0
+        image.pixels.foreach_set(values)
+        image.pack()
+        return image
+
+    def create_material(self, name, albedo, normal, depth):
+        mat = bpy.data.materials.new(name=name)
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+        bsdf = next(n for n in nodes if n.type == 'BSDF_PRINCIPLED')
+
+        albedo_node = nodes.new("ShaderNodeTexImage")
+        albedo_node.image = albedo
+        links.new(albedo_node.outputs["Color"], bsdf.inputs["Base Color"])
+        links.new(albedo_node.outputs["Alpha"], bsdf.inputs["Alpha"])
+
+        normal_node = nodes.new("ShaderNodeTexImage")
+        normal_node.image = normal
+        normal_map = nodes.new("ShaderNodeNormalMap")
+        normal_map.space = 'WORLD'
+        links.new(normal_node.outputs["Color"], normal_map.inputs["Color"])
+        links.new(normal_map.outputs["Normal"], bsdf.inputs["Normal"])
+
+        # Depth is left unconnected, engines read it for parallax/depth offset
+        depth_node = nodes.new("ShaderNodeTexImage")
+        depth_node.image = depth
+        depth_node.label = "Impostor Depth"
+        return mat
+
+    def create_quad(self, name, radius, uv_rect):
+        bm = bmesh.new()
+        corners = [(-radius, 0.0, -radius), (radius, 0.0, -radius), (radius, 0.0, radius), (-radius, 0.0, radius)]
+        face = bm.faces.new([bm.verts.new(co) for co in corners])
+        uv_layer = bm.loops.layers.uv.new("UVMap")
+        u0, v0, u1, v1 = uv_rect
+        for loop, uv in zip(face.loops, [(u0, v0), (u1, v0), (u1, v1), (u0, v1)]):
+            loop[uv_layer].uv = uv
+        mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(mesh)
+        bm.free()
+        return mesh
+
+    def execute(self, context):
+        base_obj = context.active_object
+        settings = context.scene.engine_tools_settings
+
+        if not base_obj or base_obj.type != 'MESH':
+            self.report({'ERROR'}, "Select a mesh object")
+            return {'CANCELLED'}
+
+        if base_obj.lod_items and is_impostor(base_obj.lod_items[-1].lod_object):
+            self.report({'ERROR'}, "Object already has an impostor LOD")
+            return {'CANCELLED'}
+
+        frames = settings.impostor_frames
+        size = settings.impostor_frame_resolution
+        if frames * size > MAX_IMPOSTOR_ATLAS:
+            self.report({'ERROR'}, f"Impostor atlas {frames * size}px exceeds {MAX_IMPOSTOR_ATLAS}px, lower frames or frame resolution")
+            return {'CANCELLED'}
+
+        corners = [base_obj.matrix_world @ Vector(corner) for corner in base_obj.bound_box]
+        center = sum(corners, Vector()) / len(corners)
+        radius = max((corner - center).length for corner in corners)
+        if radius <= 0.0:
+            self.report({'ERROR'}, "Mesh has no volume to render")
+            return {'CANCELLED'}
+
+        atlas_shape = (frames * size, frames * size, 4)
+        atlas = {
+            "albedo": np.zeros(atlas_shape, dtype=np.uint8),
+            "normal": np.zeros(atlas_shape, dtype=np.uint8),
+            "depth": np.zeros(atlas_shape, dtype=np.float16),
+        }
+        directions = []
+
+        wm = context.window_manager
+        wm.progress_begin(0, frames * frames)
+        with tempfile.TemporaryDirectory() as output_dir:
+            scene = camera = None
+            try:
+                scene = bpy.data.scenes.new(f"{base_obj.name}_ImpostorBake")
+                cam_name = f"{base_obj.name}_ImpostorCam"
+                camera = bpy.data.objects.new(cam_name, bpy.data.cameras.new(cam_name))
+                self.setup_scene(scene, camera, base_obj, settings, radius, output_dir)
+
+                for row in range(frames):
+                    for col in range(frames):
+                        u = (col + 0.5) / frames * 2.0 - 1.0
+                        v = (row + 0.5) / frames * 2.0 - 1.0
+                        direction = Vector(octahedral_direction(u, v))
+                        directions.append((direction, col, row))
+
+                        basis = octahedral_frame_basis(direction)
+                        camera.matrix_world = Matrix.Translation(center + direction * radius * 2.0) @ basis.to_4x4()
+                        bpy.ops.render.render(write_still=False, scene=scene.name)
+
+                        frame = scene.frame_current
+                        albedo = self.read_pass(output_dir, "albedo", frame, size)
+                        normal = self.read_pass(output_dir, "normal", frame, size)
+                        depth = self.read_pass(output_dir, "depth", frame, size)
+                        alpha = albedo[..., 3:4]
+
+                        albedo[..., :3] = linear_to_srgb(albedo[..., :3])
+                        normal[..., :3] = normal[..., :3] * 0.5 + 0.5
+                        normal[..., 3:4] = alpha
+                        # 0.5 is the plane through the bounds center, facing the camera
+                        depth[..., :3] = np.clip((depth[..., :1] - radius) / (radius * 2.0), 0.0, 1.0)
+                        depth[..., :3] = np.where(alpha > 0.0, depth[..., :3], 1.0)
+                        depth[..., 3:4] = alpha
+
+                        cell = (slice(row * size, (row + 1) * size), slice(col * size, (col + 1) * size))
+                        atlas["albedo"][cell] = np.round(np.clip(albedo, 0.0, 1.0) * 255.0)
+                        atlas["normal"][cell] = np.round(np.clip(normal, 0.0, 1.0) * 255.0)
+                        atlas["depth"][cell] = depth
+                        wm.progress_update(row * frames + col)
+            except (RuntimeError, KeyError) as e:
+                self.report({'ERROR'}, f"Impostor render failed: {str(e)}")
+                return {'CANCELLED'}
+            finally:
+                wm.progress_end()
+                if camera:
+                    cam_data = camera.data
+                    bpy.data.objects.remove(camera)
+                    bpy.data.cameras.remove(cam_data)
+                if scene:
+                    bpy.data.scenes.remove(scene)
+
+        lod_name = f"{base_obj.name}_LOD_{len(base_obj.lod_items)+1}"
+        albedo_img = self.create_atlas(f"{lod_name}_impostor_albedo", atlas["albedo"], False)
+        normal_img = self.create_atlas(f"{lod_name}_impostor_normal", atlas["normal"], True)
+        depth_img = self.create_atlas(f"{lod_name}_impostor_depth", atlas["depth"], True)
+        mat = self.create_material(f"{lod_name}_Impostor", albedo_img, normal_img, depth_img)
+
+        # The quad faces -Y and previews the frame closest to that view; engines pick frames per view
+        _, col, row = max(directions, key=lambda d: d[0].dot(Vector((0.0, -1.0, 0.0))))
+        uv_rect = (col / frames, row / frames, (col + 1) / frames, (row + 1) / frames)
+        mesh = self.create_quad(lod_name, radius, uv_rect)
+        mesh.materials.append(mat)
+
+        lod_obj = bpy.data.objects.new(lod_name, mesh)
+        lod_obj.location = center
+        lod_obj["impostor_frames"] = frames
+        context.collection.objects.link(lod_obj)
+
+        # Billboard around Z toward the scene camera for in-Blender previews
+        track = lod_obj.constraints.new('LOCKED_TRACK')
+        track.name = "Impostor_Billboard"
+        track.target = context.scene.camera
+        track.track_axis = 'TRACK_NEGATIVE_Y'
+        track.lock_axis = 'LOCK_Z'
+        if context.scene.camera is None:
+            self.report({'WARNING'}, "No scene camera, impostor billboard has no target")
+
         item = base_obj.lod_items.add()
         item.lod_object = lod_obj
         return {'FINISHED'}
@@ -224,6 +487,7 @@ classes = (
     OBJECT_OT_triangulate_mesh,
     OBJECT_OT_correct_normals,
     OBJECT_OT_add_lod,
+    OBJECT_OT_add_impostor_lod,
     OBJECT_OT_remove_lod,
     OBJECT_OT_select_lod_object,
     OBJECT_OT_merge_vertices,
@@ -49,6 +49,28 @@ class EngineToolsSettings(PropertyGroup):
         min=0.0,
         precision=4
     )
+    impostor_frames: IntProperty(
+        name="Impostor Frames",
+        description="Views per side of the octahedral impostor atlas",
+        default=8,
+        min=2,
+        max=32
+    )
+    impostor_frame_resolution: IntProperty(
+        name="Frame Resolution",
+        description="Resolution of each impostor view in the atlas",
+        default=256,
+        min=32,
+        max=2048
+    )
+    impostor_render_engine: EnumProperty(
+        name="Impostor Engine",
+        items=[
+            ('EEVEE', "EEVEE", "Fast rasterized render"),
+            ('CYCLES', "Cycles", "Path traced render")
+        ],
+        default='EEVEE'
+    )
 
 def register():
     bpy.utils.register_class(LODItem)
@@ -34,6 +34,7 @@ class VIEW3D_PT_engine_tools(Panel):
             row = lod_box.row()
             row.operator("object.add_lod", icon='ADD')
             row.operator("object.remove_lod", icon='REMOVE')
+            lod_box.operator("object.add_impostor_lod", icon='IMAGE_PLANE')
 
             # LOD Items list
             if obj.lod_items:
@@ -91,6 +92,9 @@ class VIEW3D_PT_engine_tools(Panel):
         prefs_box.label(text="Preferences", icon='PREFERENCES')
         prefs_box.prop(settings, "lod_default_ratio", slider=True)
         prefs_box.prop(settings, "merge_distance")
+        prefs_box.prop(settings, "impostor_frames")
+        prefs_box.prop(settings, "impostor_frame_resolution")
+        prefs_box.prop(settings, "impostor_render_engine")
 
         # Material Baker
         scene = context.scene
@@ -107,6 +111,7 @@ class VIEW3D_PT_engine_tools(Panel):
         baker_box.prop(scene, "material_baker_resolution", text="Resolution")
         baker_box.prop(scene, "material_baker_image_format", text="Image Format")
         baker_box.prop(scene, "material_baker_filepath", text="File Path")
+        baker_box.prop(scene, "material_baker_generate_lod_variants", text="Generate LOD Variants")
         baker_box.operator("object.material_bake", text="Bake Material", icon='RENDER_RESULT')
 
 
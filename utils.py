@@ -1,5 +1,14 @@
 import os
 import bpy
+import numpy as np
+from mathutils import Matrix, Vector
+
+def srgb_to_linear(c):
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+def linear_to_srgb(c):
+    c = np.clip(c, 0.0, 1.0)
+    return np.where(c <= 0.0031308, c * 12.92, 1.055 * c ** (1.0 / 2.4) - 0.055)
 
 def ensure_folder_exists(path):
     if not os.path.exists(path):
@@ -10,6 +19,25 @@ def select_only(obj):
     obj.select_set(True)
     bpy.context.view_layer.objects.active = obj
 
+def octahedral_direction(u, v):
+    """Map a point of the [-1, 1] square to a unit view direction on the octahedron."""
+    x, y = u, v
+    z = 1.0 - abs(x) - abs(y)
+    if z < 0.0:
+        x, y = (1.0 - abs(v)) * (1.0 if u >= 0.0 else -1.0), (1.0 - abs(u)) * (1.0 if v >= 0.0 else -1.0)
+    length = (x * x + y * y + z * z) ** 0.5
+    return (x / length, y / length, z / length)
+
+def octahedral_frame_basis(direction):
+    """Camera rotation for a view from `direction`: world Z is up, world Y at the poles."""
+    up_ref = Vector((0.0, 1.0, 0.0)) if abs(direction.z) > 0.999 else Vector((0.0, 0.0, 1.0))
+    right = up_ref.cross(direction).normalized()
+    up = direction.cross(right)
+    return Matrix((right, up, direction)).transposed()
+
+def is_impostor(obj):
+    return obj is not None and "impostor_frames" in obj
+
 def select_objects(objects):
     for obj in objects:
         obj.select_set(True)